@@ -17,105 +17,165 @@
 // NEXUS_EVO: 0JPXV8
 } catch (e) {
       clearTimeout(timeoutId);
-      if (retryCount < CONFIG.MAX_API_RETRIES && state.isLive) {
-        await new Promise(r => setTimeout(r, Math.pow(2, retryCount) * 1000));
+      if (isRetryable(e) && retryCount < Math.min(CONFIG.MAX_API_RETRIES, GEMINI_MAX_RETRIES) && isLiveRef.current && !geminiExpired(prompt)) {
+        await sleep(backoffDelay(retryCount));
+        if (geminiExpired(prompt)) throw e;
+        await geminiLimiter.acquire();
         return callGeminiAPI(prompt, personaText, modelId, apiKey, retryCount + 1);
       }
       throw e;
     }
   }, [state.isLive]);
 
-  const processFile = async (filePath, owner, repo, token, apiKey, modelId) => {
-    const path = filePath.split('/').map(encodeURIComponent).join('/');
-    const url = `https://api.github.com/repos/${owner}/${repo}/contents/${path}`;
-    const headers = { 'Authorization': `token ${token}`, 'Accept': 'application/vnd.github.v3+json' };
-
-    const res = await fetch(url, { headers });
-    if (!res.ok) throw new Error(`Fetch Error ${res.status}`);
-    const data = await res.json();
-    let content = decodeBase64(data.content);
-    
-    dispatch({ type: 'SET_STATUS', value: 'PROCESSING', path: filePath });
-    const processed = await callGeminiAPI(content, PIPELINES.GENERIC[0].text, modelId, apiKey);
-    
-    if (processed && processed !== content && processed.length > 5) {
-      await fetch(url, {
-        method: 'PUT',
-        headers: { ...headers, 'Content-Type': 'application/json' },
-        body: JSON.stringify({ message: `Sovereign: ${filePath}`, content: encodeBase64(processed), sha: data.sha })
-      });
-      return { status: 'MUTATED', filePath };
-    }
-    return { status: 'SKIPPED', filePath };
-  };
+  useEffect(() => preconnect(API_ORIGINS), []);
 
-  const runCycle = useCallback(async () => {
-    if (!state.isLive || isProcessingRef.current || !state.isIndexed || !user) return;
-    isProcessingRef.current = true;
+  const completedRef = useRef(0);
+  const fileSizesRef = useRef(new Map());
+  const blobShasRef = useRef(new Map());
+  const pendingActionsRef = useRef([]);
+  const isLiveRef = useRef(false);
+  const githubTokensRef = useRef(null);
+  // Separate from abortControllerRef, which callGeminiAPI replaces on every call.
+  const runControllerRef = useRef(null);
+  const pendingWritesRef = useRef([]);
+  const flushTimerRef = useRef(null);
 
-    const target = queueRef.current[currentIndexRef.current];
-    if (!target) {
-      addLog("Job Finished.", "success");
-      dispatch({ type: 'MARK_COMPLETE' });
-      isProcessingRef.current = false;
-      return;
+  // Workers finishing within the same frame share one render; React batches dispatches made inside the flush.
+  // Hidden tabs suspend rAF, so a timer backs it up and whichever fires first drains the queue.
+  const enqueueDispatch = useCallback((action) => {
+    if (pendingActionsRef.current.push(action) > 1) return;
+    const flush = () => {
+      const actions = pendingActionsRef.current;
+      pendingActionsRef.current = [];
+      actions.forEach(dispatch);
+    };
+    requestAnimationFrame(flush);
+    setTimeout(flush, DISPATCH_FALLBACK_MS);
+  }, []);
+
+  const flushHistory = useCallback(() => {
+    clearTimeout(flushTimerRef.current);
+    flushTimerRef.current = null;
+    const writes = pendingWritesRef.current;
+    pendingWritesRef.current = [];
+    for (let i = 0; i < writes.length; i += HISTORY_BATCH_LIMIT) {
+      commitHistoryBatch(db, writes.slice(i, i + HISTORY_BATCH_LIMIT)).catch(() => {});
     }
+  }, []);
+
+  const queueHistory = useCallback((ref, data) => {
+    if (pendingWritesRef.current.push({ ref, data }) >= HISTORY_BATCH_LIMIT) return flushHistory();
+    flushTimerRef.current ??= setTimeout(flushHistory, HISTORY_FLUSH_MS);
+  }, [flushHistory]);
 
+  // Workers read the latest render's values through this ref, so runBatch and the live effect keep a stable identity.
+  const latestRef = useRef(null);
+  latestRef.current = { targetRepo: state.targetRepo, modelId: state.selectedModel, user, addLog, callGeminiAPI };
+
+  const runBatch = useCallback(async (targets) => {
+    const { targetRepo, modelId, user, addLog, callGeminiAPI } = latestRef.current;
+    const signal = runControllerRef.current?.signal;
     try {
-      const [owner, repo] = parseRepoPath(state.targetRepo);
-      const result = await processFile(target, owner, repo, ghTokenRef.current, geminiKeyRef.current, state.selectedModel);
-      
-      if (result.status === 'MUTATED') {
-        const docRef = doc(db, 'artifacts', CONFIG.APP_ID, 'users', user.uid, 'history', safeDocId(target));
-        await setDoc(docRef, { path: target, ts: serverTimestamp() }).catch(() => {});
-        addLog(`MUTATED: ${target.split('/').pop()}`, "success");
-        dispatch({ type: 'UPDATE_METRICS', m: 1 });
-      } else {
-        addLog(`CLEAN: ${target.split('/').pop()}`, "info");
+      const [owner, repo] = parseRepoPath(targetRepo);
+      const ctx = {
+        owner, repo, modelId, callGeminiAPI, enqueueDispatch,
+        tokens: githubTokensRef.current,
+        apiKey: geminiKeyRef.current,
+        signal,
+        blobShas: blobShasRef.current,
+      };
+      const results = targets.length === 1 ? [await processFile(ctx, targets[0])] : await processBatch(ctx, targets);
+
+      for (const { status, filePath, message } of results) {
+        if (status === 'FAULT') {
+          addLog(`FAULT: ${filePath.split('/').pop()}: ${message}`, "error");
+          enqueueDispatch({ type: 'UPDATE_METRICS', e: 1 });
+        } else if (status === 'MUTATED') {
+          const docRef = doc(db, 'artifacts', CONFIG.APP_ID, 'users', user.uid, 'history', safeDocId(filePath));
+          queueHistory(docRef, { path: filePath, ts: serverTimestamp() });
+          addLog(`MUTATED: ${filePath.split('/').pop()}`, "success");
+          enqueueDispatch({ type: 'UPDATE_METRICS', m: 1 });
+        } else {
+          addLog(`CLEAN: ${filePath.split('/').pop()}`, "info");
+        }
       }
     } catch (e) {
-      if (e.name !== 'AbortError') {
-        addLog(`FAULT: ${e.message}`, "error");
-        dispatch({ type: 'UPDATE_METRICS', e: 1 });
-      }
-    } finally {
-      currentIndexRef.current++;
-      dispatch({ type: 'UPDATE_METRICS', cursor: currentIndexRef.current, total: queueRef.current.length });
-      isProcessingRef.current = false;
-      dispatch({ type: 'SET_STATUS', value: 'IDLE' });
+      // Only a stopped run is rolled back; any other abort (e.g. a Gemini attempt timing out) is a fault like the rest.
+      if (signal?.aborted || !isLiveRef.current) return false;
+      addLog(`FAULT: ${e.message}`, "error");
+      enqueueDispatch({ type: 'UPDATE_METRICS', e: targets.length });
     }
-  }, [state.isLive, state.targetRepo, state.selectedModel, state.isIndexed, user, addLog]);
+    completedRef.current += targets.length;
+    enqueueDispatch({ type: 'UPDATE_METRICS', cursor: completedRef.current, total: queueRef.current.length });
+    return true;
+  }, [enqueueDispatch, queueHistory]);
 
   useEffect(() => {
-    if (!state.isLive) return;
-    const timer = setInterval(runCycle, CONFIG.CYCLE_INTERVAL_MS);
-    runCycle();
-    return () => clearInterval(timer);
-  }, [state.isLive, runCycle]);
+    if (!state.isLive || !state.isIndexed || !user) return;
+    let cancelled = false;
+    const pool = createPool(MAX_CONCURRENCY);
+    const controller = new AbortController();
+    runControllerRef.current = controller;
+    isLiveRef.current = true;
+    completedRef.current = currentIndexRef.current;
+
+    // Batches are claimed when a worker picks them up; one cut short by Stop pulls the cursor back to its start,
+    // so a resume redoes it (finished files after it are skipped by their cached shas).
+    for (const [start, end] of planBatches(queueRef.current, fileSizesRef.current, currentIndexRef.current)) {
+      pool.add(async () => {
+        if (!isLiveRef.current) return;
+        currentIndexRef.current = end;
+        if (!await runBatch(queueRef.current.slice(start, end))) {
+          currentIndexRef.current = Math.min(currentIndexRef.current, start);
+        }
+      });
+    }
+
+    // Routed through the same queue so a late PROCESSING status cannot land after these.
+    pool.onIdle().then(() => {
+      flushHistory();
+      if (cancelled) return enqueueDispatch({ type: 'SET_STATUS', value: 'IDLE' });
+      latestRef.current.addLog("Job Finished.", "success");
+      enqueueDispatch({ type: 'MARK_COMPLETE' });
+    });
 
-  const handleMainButton = async () => {
+    return () => {
+      cancelled = true;
+      isLiveRef.current = false;
+      controller.abort();
+      pool.clear();
+      flushHistory();
+    };
+  }, [state.isLive, state.isIndexed, user, runBatch, enqueueDispatch, flushHistory]);
+
+  const handleMainButton = useCallback(async () => {
     if (state.isLive) {
+      isLiveRef.current = false;
       dispatch({ type: 'TOGGLE_LIVE' });
+      runControllerRef.current?.abort();
       abortControllerRef.current?.abort();
       return;
     }
     if (state.isIndexed) return dispatch({ type: 'TOGGLE_LIVE' });
 
     const repoPath = parseRepoPath(state.targetRepo);
-    if (!repoPath || !ghTokenRef.current || !geminiKeyRef.current) return addLog("Configuration Incomplete", "error");
+    const tokens = createTokenPool(ghTokenRef.current || '');
+    if (!repoPath || !tokens.size || !geminiKeyRef.current) return addLog("Configuration Incomplete", "error");
 
     dispatch({ type: 'SET_STATUS', value: 'INDEXING' });
     try {
       const [owner, repo] = repoPath;
-      const headers = { 'Authorization': `token ${ghTokenRef.current}` };
-      const repoData = await (await fetch(`https://api.github.com/repos/${owner}/${repo}`, { headers })).json();
-      const tree = await (await fetch(`https://api.github.com/repos/${owner}/${repo}/git/trees/${repoData.default_branch}?recursive=1`, { headers })).json();
+      const blobs = await fetchRepoBlobs(owner, repo, tokens);
 
-      queueRef.current = (tree.tree || [])
-        .filter(f => f.type === 'blob' && f.size < CONFIG.MAX_FILE_SIZE_BYTES && !SKIP_PATTERNS.some(p => p.test(f.path)) && FILE_EXTENSIONS.ALL.test(f.path))
+      queueRef.current = blobs
+        .filter(f => f.size < CONFIG.MAX_FILE_SIZE_BYTES && FILE_EXTENSIONS.ALL.test(f.path) && !SKIP_RES.some(re => re.test(f.path)))
         .map(f => f.path);
+      fileSizesRef.current = new Map(blobs.map(f => [f.path, f.size]));
+      blobShasRef.current = new Map(blobs.map(f => [f.path, f.sha]));
+      githubTokensRef.current = tokens;
 
       currentIndexRef.current = 0;
+      completedRef.current = 0;
       dispatch({ type: 'SET_VAL', key: 'isIndexed', value: true });
       addLog(`Indexed ${queueRef.current.length} items.`, "success");
     } catch (e) {
@@ -123,7 +183,20 @@
     } finally {
       dispatch({ type: 'SET_STATUS', value: 'IDLE' });
     }
-  };
+  }, [state.isLive, state.isIndexed, state.targetRepo, addLog]);
+
+  const controls = useMemo(() => {
+    if (state.isLive) return { ...LIVE_CONTROLS, button: 'bg-red-600 text-white', label: 'Stop' };
+    return state.isIndexed
+      ? { ...IDLE_CONTROLS, button: 'bg-emerald-600 text-white', label: 'Start' }
+      : { ...IDLE_CONTROLS, button: 'bg-white text-black hover:bg-zinc-200', label: 'Index' };
+  }, [state.isLive, state.isIndexed]);
+
+  const metricTiles = useMemo(() => [
+    { l: 'Mutations', v: state.metrics.mutations, c: 'text-emerald-500' },
+    { l: 'Progress', v: `${state.metrics.progress}%`, c: 'text-white' },
+    { l: 'Faults', v: state.metrics.errors, c: 'text-red-500' }
+  ], [state.metrics]);
 
   if (!state.isAcknowledged) {
     return (
@@ -144,19 +217,19 @@
         
         <header className="p-8 md:p-10 rounded-[3rem] bg-zinc-900/50 border border-white/5 flex flex-col lg:flex-row items-center justify-between gap-8 backdrop-blur-md">
           <div className="flex items-center gap-8">
-            <div className={`w-16 h-16 rounded-3xl flex items-center justify-center text-3xl border transition-all ${state.isLive ? 'bg-emerald-500/10 text-emerald-500 border-emerald-500/30 animate-pulse' : 'bg-zinc-800/20 text-zinc-700 border-zinc-800'}`}>
-              {state.isLive ? '⚡' : '💿'}
+            <div className={`w-16 h-16 rounded-3xl flex items-center justify-center text-3xl border transition-all ${controls.icon}`}>
+              {controls.glyph}
             </div>
             <div>
               <h1 className="text-2xl font-black text-white uppercase italic tracking-tighter">Sovereign</h1>
               <div className="flex items-center gap-4 mt-1">
-                <span className={`px-3 py-0.5 rounded text-[10px] font-black uppercase tracking-widest ${state.isLive ? 'bg-emerald-600 text-white' : 'bg-zinc-800 text-zinc-500'}`}>{state.status}</span>
+                <span className={`px-3 py-0.5 rounded text-[10px] font-black uppercase tracking-widest ${controls.pill}`}>{state.status}</span>
                 <span className="text-[10px] text-zinc-500 font-bold truncate max-w-[200px]">{state.activePath}</span>
               </div>
             </div>
           </div>
-          <button onClick={handleMainButton} className={`px-14 py-5 rounded-2xl text-[11px] font-black uppercase tracking-widest transition-all ${state.isLive ? 'bg-red-600 text-white' : state.isIndexed ? 'bg-emerald-600 text-white' : 'bg-white text-black hover:bg-zinc-200'}`}>
-            {state.isLive ? 'Stop' : state.isIndexed ? 'Start' : 'Index'}
+          <button onClick={handleMainButton} className={`px-14 py-5 rounded-2xl text-[11px] font-black uppercase tracking-widest transition-all ${controls.button}`}>
+            {controls.label}
           </button>
         </header>
 
@@ -180,7 +253,7 @@
 
           <main className="lg:col-span-8 space-y-8">
             <div className="grid grid-cols-3 gap-6">
-              {[ { l: 'Mutations', v: state.metrics.mutations, c: 'text-emerald-500' }, { l: 'Progress', v: `${state.metrics.progress}%`, c: 'text-white' }, { l: 'Faults', v: state.metrics.errors, c: 'text-red-500' } ].map((m, i) => (
+              {metricTiles.map((m, i) => (
                 <div key={i} className="p-8 bg-zinc-900/30 border border-white/5 rounded-[2.5rem] text-center">
                   <div className={`text-3xl font-black mb-1 tabular-nums ${m.c}`}>{m.v}</div>
                   <div className="text-[9px] font-black uppercase text-zinc-600 tracking-widest">{m.l}</div>
@@ -190,14 +263,7 @@
 
             <div className="h-[500px] bg-black border border-white/5 rounded-[3.5rem] flex flex-col overflow-hidden shadow-2xl">
               <div className="px-10 py-6 border-b border-white/5 bg-zinc-900/10 text-[12px] font-black text-zinc-500 uppercase tracking-widest">Telemetry Log</div>
-              <div className="flex-1 overflow-y-auto p-10 space-y-3 log-area">
-                {state.logs.map((l, i) => (
-                  <div key={i} className={`text-[12px] flex gap-4 ${l.type === 'error' ? 'text-red-400' : l.type === 'success' ? 'text-emerald-400' : 'text-zinc-500'}`}>
-                    <span className="opacity-30 shrink-0">{l.timestamp}</span>
-                    <span className="font-medium">{l.msg}</span>
-                  </div>
-                ))}
-              </div>
+              <LogList logs={state.logs} />
             </div>
           </main>
         </div>
@@ -206,3 +272,510 @@
     </div>
   );
 }
+
+const MAX_CONCURRENCY = 6;
+
+const createPool = (concurrency) => {
+  const pending = [];
+  let active = 0;
+  let idleWaiters = [];
+
+  const next = () => {
+    if (!pending.length) {
+      if (!active) {
+        idleWaiters.forEach(resolve => resolve());
+        idleWaiters = [];
+      }
+      return;
+    }
+    if (active >= concurrency) return;
+    active++;
+    Promise.resolve().then(pending.shift()).catch(() => {}).finally(() => {
+      active--;
+      next();
+    });
+    next();
+  };
+
+  return {
+    add: (task) => { pending.push(task); next(); },
+    clear: () => { pending.length = 0; },
+    onIdle: () => (!active && !pending.length) ? Promise.resolve() : new Promise(resolve => idleWaiters.push(resolve)),
+  };
+};
+
+const createLimiter = ({ rpm, burst }) => {
+  let tokens = burst;
+  let last = Date.now();
+  let blockedUntil = 0;
+
+  const refill = () => {
+    const now = Date.now();
+    tokens = Math.min(burst, tokens + (now - last) * rpm / 60000);
+    last = now;
+  };
+
+  return {
+    acquire: async (signal) => {
+      for (;;) {
+        refill();
+        const wait = Math.max(blockedUntil - Date.now(), tokens >= 1 ? 0 : (1 - tokens) * 60000 / rpm);
+        if (wait <= 0) {
+          tokens--;
+          return;
+        }
+        await sleep(wait, signal);
+      }
+    },
+    observe: (res) => {
+      const remaining = res.headers.get('X-RateLimit-Remaining');
+      const reset = Number(res.headers.get('X-RateLimit-Reset'));
+      const retryAfter = Number(res.headers.get('Retry-After'));
+      if (remaining !== null) tokens = Math.min(tokens, Number(remaining));
+      if (retryAfter) blockedUntil = Date.now() + retryAfter * 1000;
+      else if (remaining === '0' && reset) blockedUntil = reset * 1000;
+    },
+  };
+};
+
+// Longer than a frame, so visible tabs still flush on rAF.
+const DISPATCH_FALLBACK_MS = 250;
+
+const LIVE_CONTROLS = Object.freeze({ icon: 'bg-emerald-500/10 text-emerald-500 border-emerald-500/30 animate-pulse', glyph: '⚡', pill: 'bg-emerald-600 text-white' });
+const IDLE_CONTROLS = Object.freeze({ icon: 'bg-zinc-800/20 text-zinc-700 border-zinc-800', glyph: '💿', pill: 'bg-zinc-800 text-zinc-500' });
+
+const API_ORIGINS = ['https://api.github.com', 'https://generativelanguage.googleapis.com'];
+
+// Browsers pool connections per origin on their own; warming them up front takes the TLS handshake off the first requests.
+const preconnect = (origins) => {
+  for (const href of origins) {
+    if (document.head.querySelector(`link[rel="preconnect"][href="${href}"]`)) continue;
+    const link = document.createElement('link');
+    link.rel = 'preconnect';
+    link.href = href;
+    link.crossOrigin = 'anonymous';
+    document.head.appendChild(link);
+  }
+};
+
+// Firestore caps a write batch at 500 operations.
+const HISTORY_BATCH_LIMIT = 450;
+const HISTORY_FLUSH_MS = 500;
+
+const commitHistoryBatch = (db, writes) => {
+  const batch = writeBatch(db);
+  writes.forEach(({ ref, data }) => batch.set(ref, data));
+  return batch.commit();
+};
+
+const GEMINI_MAX_RETRIES = 3;
+const GEMINI_CALL_BUDGET_MS = 120_000;
+
+// Caps a call including its retries so a straggler cannot hold a pool slot indefinitely.
+const withDeadline = (promise, ms, controller) => {
+  let timer;
+  const deadline = new Promise((_, reject) => {
+    timer = setTimeout(() => {
+      controller?.abort();
+      reject(new Error(`Timed out after ${ms / 1000}s`));
+    }, ms);
+  });
+  return Promise.race([promise, deadline]).finally(() => clearTimeout(timer));
+};
+
+// callGeminiAPI only receives the prompt, so its retry loop finds deadlines by prompt. Duplicate files share a prompt,
+// and a retry cannot tell which of them it belongs to, so it gives up only once every call with that prompt has expired.
+const geminiDeadlines = new Map();
+const geminiExpired = (prompt) => {
+  const signals = geminiDeadlines.get(prompt);
+  return Boolean(signals) && [...signals].every(signal => signal.aborted);
+};
+
+// GitHub allows 5000 requests/hour per token; Gemini RPM depends on the model tier.
+const GITHUB_TOKEN_LIMITS = { rpm: 80, burst: 20 };
+const geminiLimiter = createLimiter({ rpm: 30, burst: MAX_CONCURRENCY });
+
+const GITHUB_MAX_RETRIES = 3;
+const BACKOFF_BASE_MS = 1000;
+const BACKOFF_CAP_MS = 30_000;
+
+// A quota wait can run to the hourly reset, so it has to give way to Stop.
+const sleep = (ms, signal) => new Promise((resolve, reject) => {
+  if (signal?.aborted) return reject(signal.reason);
+  const timer = setTimeout(resolve, ms);
+  signal?.addEventListener('abort', () => {
+    clearTimeout(timer);
+    reject(signal.reason);
+  }, { once: true });
+});
+
+// Full jitter keeps concurrent workers from retrying in lockstep; Retry-After is a floor.
+const backoffDelay = (retryCount, retryAfterMs = 0) =>
+  Math.max(Math.min(BACKOFF_CAP_MS, Math.random() * BACKOFF_BASE_MS * 2 ** retryCount), retryAfterMs);
+
+// callGeminiAPI throws plain Errors; an HTTP failure only carries its status in the "API Error: <status>" message.
+const errorStatus = (e) => e.status ?? Number(/\bAPI Error:? (\d{3})\b/.exec(e.message)?.[1]);
+
+const isRetryable = (e) => {
+  const status = errorStatus(e);
+  return !status || status === 429 || status >= 500;
+};
+
+const retryAfterMs = (res) => Number(res.headers.get('Retry-After')) * 1000 || 0;
+
+// Several PATs may be pasted separated by whitespace or commas; each keeps its own bucket and quota.
+const createTokenPool = (raw) => {
+  const entries = raw.split(/[\s,]+/).filter(Boolean)
+    .map(token => ({ token, limiter: createLimiter(GITHUB_TOKEN_LIMITS), remaining: Infinity }));
+  let cursor = 0;
+
+  return {
+    size: entries.length,
+    // Starting from a rotating cursor makes ties round-robin instead of always landing on the first token.
+    next: () => {
+      let best = entries[cursor++ % entries.length];
+      for (const e of entries) if (e.remaining > best.remaining) best = e;
+      return best;
+    },
+    observe: (entry, res) => {
+      const remaining = res.headers.get('X-RateLimit-Remaining');
+      if (remaining !== null) entry.remaining = Number(remaining);
+      entry.limiter.observe(res);
+    },
+  };
+};
+
+const githubFetch = async (url, init, tokens, retryCount = 0) => {
+  const entry = tokens.next();
+  await entry.limiter.acquire(init.signal);
+  let res;
+  try {
+    res = await fetch(url, { ...init, headers: { ...init.headers, 'Authorization': `token ${entry.token}` } });
+  } catch (e) {
+    if (e.name === 'AbortError' || retryCount >= GITHUB_MAX_RETRIES) throw e;
+    await sleep(backoffDelay(retryCount), init.signal);
+    return githubFetch(url, init, tokens, retryCount + 1);
+  }
+  tokens.observe(entry, res);
+
+  // The primary limit and many secondary limits answer 403 with no Retry-After; observe() has already blocked the
+  // token until X-RateLimit-Reset, so the retry's acquire waits that out (or moves to another pooled token).
+  const throttled = res.status === 429 || (res.status === 403 && (res.headers.has('Retry-After') || res.headers.get('X-RateLimit-Remaining') === '0'));
+  if ((throttled || res.status >= 500) && retryCount < GITHUB_MAX_RETRIES) {
+    await sleep(backoffDelay(retryCount, retryAfterMs(res)), init.signal);
+    return githubFetch(url, init, tokens, retryCount + 1);
+  }
+  return res;
+};
+
+// One alternation per flag set, so a case-insensitive pattern does not widen the others.
+const combinePatterns = (patterns) => {
+  const byFlags = new Map();
+  for (const { source, flags } of patterns) {
+    byFlags.set(flags, [...(byFlags.get(flags) || []), `(?:${source})`]);
+  }
+  return [...byFlags].map(([flags, sources]) => new RegExp(sources.join('|'), flags.replace(/[gy]/g, '')));
+};
+
+const SKIP_RES = combinePatterns(SKIP_PATTERNS);
+
+// GraphQL has no recursive tree field, so the query nests entries to a fixed depth.
+const TREE_QUERY_DEPTH = 6;
+
+const TREE_QUERY = (() => {
+  let entries = 'entries { path type object { oid ... on Blob { byteSize } } }';
+  for (let i = 1; i < TREE_QUERY_DEPTH; i++) {
+    entries = `entries { path type object { oid ... on Blob { byteSize } ... on Tree { ${entries} } } }`;
+  }
+  return `query($owner: String!, $name: String!) { repository(owner: $owner, name: $name) { object(expression: "HEAD:") { ... on Tree { ${entries} } } } }`;
+})();
+
+const flattenTree = (entries = [], out = { blobs: [], truncated: false }) => {
+  for (const e of entries) {
+    if (e.type === 'blob') out.blobs.push({ path: e.path, size: e.object?.byteSize ?? 0, sha: e.object?.oid });
+    else if (e.type !== 'tree') continue;
+    else if (e.object?.entries) flattenTree(e.object.entries, out);
+    else out.truncated = true;
+  }
+  return out;
+};
+
+// blobs is null when the tree is deeper than the query reaches (truncated), or when a large nested query errors or times out.
+const queryRepoBlobs = async (owner, repo, tokens) => {
+  const res = await githubFetch('https://api.github.com/graphql', {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ query: TREE_QUERY, variables: { owner, name: repo } })
+  }, tokens);
+  if (!res.ok) return { blobs: null, truncated: false };
+  const { data, errors } = await res.json();
+  if (errors?.length || !data?.repository?.object) return { blobs: null, truncated: false };
+
+  const { blobs, truncated } = flattenTree(data.repository.object.entries);
+  return { blobs: truncated ? null : blobs, truncated };
+};
+
+const restRepoBlobs = async (owner, repo, tokens) => {
+  const repoData = await (await githubFetch(`https://api.github.com/repos/${owner}/${repo}`, {}, tokens)).json();
+  const tree = await (await githubFetch(`https://api.github.com/repos/${owner}/${repo}/git/trees/${repoData.default_branch}?recursive=1`, {}, tokens)).json();
+  return (tree.tree || []).filter(f => f.type === 'blob');
+};
+
+// The HEAD sha lookup is conditional, so an unchanged branch costs a free 304 instead of a full re-index.
+const fetchRepoBlobs = async (owner, repo, tokens) => {
+  const cacheKey = `tree:${owner}/${repo}`;
+  const cached = await shaCache.get(cacheKey);
+  const head = await githubFetch(`https://api.github.com/repos/${owner}/${repo}/commits/HEAD`, {
+    headers: { 'Accept': 'application/vnd.github.sha', ...(cached?.etag && { 'If-None-Match': cached.etag }) }
+  }, tokens);
+  if (head.status === 304 && cached?.blobs) return cached.blobs;
+
+  // A repo deeper than the query goes straight to REST on later re-indexes; a failed query is simply tried again.
+  const queried = cached?.deep ? { blobs: null, truncated: true } : await queryRepoBlobs(owner, repo, tokens);
+  const blobs = queried.blobs ?? await restRepoBlobs(owner, repo, tokens);
+  if (head.ok) shaCache.set(cacheKey, { etag: head.headers.get('ETag'), deep: queried.truncated, blobs: blobs.map(({ path, size, sha }) => ({ path, size, sha })) });
+  return blobs;
+};
+
+// Small files share one Gemini prompt; ~4 bytes per token keeps a batch near 6k tokens.
+const BATCH_BYTE_BUDGET = 24_000;
+const BATCH_MAX_FILES = 8;
+
+const BATCH_INSTRUCTIONS = 'The input contains several files, each wrapped as <<<FILE id=N path=...>>> ... <<<END N>>>. Process every file independently and return each result wrapped in the same delimiters with the same id. Output nothing outside the delimiters.';
+
+const planBatches = (queue, sizes, from) => {
+  const batches = [];
+  let start = from;
+  let bytes = 0;
+  for (let i = from; i < queue.length; i++) {
+    const size = sizes.get(queue[i]) ?? BATCH_BYTE_BUDGET;
+    if (i > start && (bytes + size > BATCH_BYTE_BUDGET || i - start >= BATCH_MAX_FILES)) {
+      batches.push([start, i]);
+      start = i;
+      bytes = 0;
+    }
+    bytes += size;
+  }
+  if (start < queue.length) batches.push([start, queue.length]);
+  return batches;
+};
+
+const marshalBatch = (files) => files
+  .map((f, i) => `<<<FILE id=${i} path=${f.filePath}>>>\n${f.content}\n<<<END ${i}>>>`)
+  .join('\n');
+
+const unmarshalBatch = (text = '') => {
+  const outputs = new Map();
+  for (const [, id, body] of text.matchAll(/<<<FILE id=(\d+)[^>\n]*>>>\n?([\s\S]*?)\n?<<<END \1>>>/g)) {
+    outputs.set(Number(id), body);
+  }
+  return outputs;
+};
+
+// Contents API writes to one branch must be serial; concurrent PUTs race on the branch head and fail with 409.
+let putChain = Promise.resolve();
+const serialPut = (request) => {
+  const run = putChain.then(request);
+  putChain = run.catch(() => {});
+  return run;
+};
+
+// The per-file pipeline lives outside App; everything run-specific arrives through the ctx built in runBatch.
+const askGemini = async (ctx, prompt, personaText) => {
+  await geminiLimiter.acquire();
+  const controller = new AbortController();
+  const signals = geminiDeadlines.get(prompt) ?? new Set();
+  geminiDeadlines.set(prompt, signals.add(controller.signal));
+  const call = ctx.callGeminiAPI(prompt, personaText, ctx.modelId, ctx.apiKey);
+  // Cleared when the call itself settles, since an expired call keeps unwinding after the race has rejected.
+  call.catch(() => {}).finally(() => {
+    signals.delete(controller.signal);
+    if (!signals.size && geminiDeadlines.get(prompt) === signals) geminiDeadlines.delete(prompt);
+  });
+  return withDeadline(call, GEMINI_CALL_BUDGET_MS, controller);
+};
+
+const fetchFile = async (ctx, filePath) => {
+  const path = filePath.split('/').map(encodeURIComponent).join('/');
+  const url = `https://api.github.com/repos/${ctx.owner}/${ctx.repo}/contents/${path}`;
+  const cacheKey = `${ctx.owner}/${ctx.repo}/${filePath}`;
+  const sha = ctx.blobShas.get(filePath);
+  const cached = await shaCache.get(cacheKey);
+  // The index already carries each blob sha, so known content is skipped without a request.
+  if (sha && (cached?.sha === sha || await seenBlobs.has(sha))) return { filePath, unchanged: true };
+
+  const res = await githubFetch(url, { headers: { 'Accept': 'application/vnd.github.raw' }, signal: ctx.signal }, ctx.tokens);
+  if (!res.ok) throw new Error(`Fetch Error ${res.status}`);
+  return { filePath, url, cacheKey, sha, content: await res.text() };
+};
+
+const commitFile = async (ctx, file, processed) => {
+  if (file.unchanged) return { status: 'SKIPPED', filePath: file.filePath };
+  // Batch framing and model whitespace handling both shift trailing newlines; that alone is not a change.
+  if (processed?.trimEnd() === file.content.trimEnd()) {
+    shaCache.set(file.cacheKey, { sha: file.sha });
+    seenBlobs.add(file.sha);
+    return { status: 'SKIPPED', filePath: file.filePath };
+  }
+  // A missing or degenerate reply says nothing about the file, so it stays unrecorded and is retried next run.
+  if (!processed || processed.length <= 5) return { status: 'FAULT', filePath: file.filePath, message: 'No usable output from Gemini' };
+  // Keep the file's own trailing whitespace so a mutation does not also rewrite the last line.
+  const output = processed.trimEnd() + file.content.slice(file.content.trimEnd().length);
+  const body = JSON.stringify({ message: `Sovereign: ${file.filePath}`, content: textToBase64(output), sha: file.sha });
+  const putRes = await serialPut(() => githubFetch(file.url, {
+    method: 'PUT',
+    headers: { 'Accept': 'application/vnd.github.v3+json', 'Content-Type': 'application/json' },
+    body,
+    signal: ctx.signal
+  }, ctx.tokens));
+  if (!putRes.ok) throw new Error(`Commit Error ${putRes.status}`);
+  const { content } = await putRes.json();
+  shaCache.set(file.cacheKey, { sha: content.sha });
+  seenBlobs.add(content.sha);
+  ctx.blobShas.set(file.filePath, content.sha);
+  return { status: 'MUTATED', filePath: file.filePath };
+};
+
+const processFile = async (ctx, filePath) => {
+  const file = await fetchFile(ctx, filePath);
+  if (file.unchanged) return commitFile(ctx, file);
+
+  ctx.enqueueDispatch({ type: 'SET_STATUS', value: 'PROCESSING', path: filePath });
+  const processed = await askGemini(ctx, file.content, PIPELINES.GENERIC[0].text);
+  return commitFile(ctx, file, processed);
+};
+
+// Per-file failures stay with their file; an abort still unwinds the whole batch.
+const asFault = (filePath, e) => {
+  if (e.name === 'AbortError') throw e;
+  return { status: 'FAULT', filePath, message: e.message };
+};
+
+const processBatch = async (ctx, filePaths) => {
+  const files = await Promise.all(filePaths.map(p => fetchFile(ctx, p).catch(e => asFault(p, e))));
+  const pending = files.filter(f => f.content !== undefined);
+  let outputs = new Map();
+
+  if (pending.length) {
+    ctx.enqueueDispatch({ type: 'SET_STATUS', value: 'PROCESSING', path: `${pending.length} files` });
+    const response = await askGemini(ctx, marshalBatch(pending), `${PIPELINES.GENERIC[0].text}\n\n${BATCH_INSTRUCTIONS}`);
+    outputs = unmarshalBatch(response);
+  }
+  return Promise.all(files.map(file => file.status ? file
+    : commitFile(ctx, file, outputs.get(pending.indexOf(file))).catch(e => asFault(file.filePath, e))));
+};
+
+// Remembers the blob sha of every file already handled (plus the repo index and its HEAD ETag), so unchanged files skip Gemini on later runs.
+// The database keeps its original name so existing caches survive the rename.
+const CACHE_DB_NAME = 'sovereign-etag-cache';
+const CACHE_STORE = 'entries';
+
+let cacheDb;
+const openCacheDb = () => cacheDb ??= new Promise((resolve, reject) => {
+  const req = indexedDB.open(CACHE_DB_NAME, 1);
+  req.onupgradeneeded = () => req.result.createObjectStore(CACHE_STORE);
+  req.onsuccess = () => resolve(req.result);
+  req.onerror = () => reject(req.error);
+});
+
+const cacheRequest = async (mode, op) => {
+  try {
+    const store = (await openCacheDb()).transaction(CACHE_STORE, mode).objectStore(CACHE_STORE);
+    return await new Promise((resolve, reject) => {
+      const req = op(store);
+      req.onsuccess = () => resolve(req.result);
+      req.onerror = () => reject(req.error);
+    });
+  } catch {
+    return undefined;
+  }
+};
+
+const shaCache = {
+  get: (key) => cacheRequest('readonly', store => store.get(key)),
+  set: (key, value) => cacheRequest('readwrite', store => store.put(value, key)),
+};
+
+// Only the rows inside the viewport (plus overscan) are mounted, so render cost stays flat as the log grows.
+const LOG_ROW_HEIGHT = 30;
+const LOG_OVERSCAN = 10;
+
+const LogRow = React.memo(({ log }) => (
+  <div style={{ height: LOG_ROW_HEIGHT }} className={`text-[12px] flex items-center gap-4 ${log.type === 'error' ? 'text-red-400' : log.type === 'success' ? 'text-emerald-400' : 'text-zinc-500'}`}>
+    <span className="opacity-30 shrink-0">{log.timestamp}</span>
+    <span className="font-medium truncate">{log.msg}</span>
+  </div>
+));
+
+function LogList({ logs }) {
+  const containerRef = useRef(null);
+  const [scrollTop, setScrollTop] = useState(0);
+  const [viewportHeight, setViewportHeight] = useState(0);
+  const [onScreen, setOnScreen] = useState(true);
+  const shownRef = useRef(logs);
+
+  useEffect(() => {
+    const el = containerRef.current;
+    setViewportHeight(el.clientHeight);
+    const observer = new IntersectionObserver(([entry]) => setOnScreen(entry.isIntersecting));
+    observer.observe(el);
+    return () => observer.disconnect();
+  }, []);
+
+  // New entries are prepended; while the pane is off-screen or scrolled into history the list holds still and catches up on return.
+  if (onScreen && scrollTop < LOG_ROW_HEIGHT) shownRef.current = logs;
+  const shown = shownRef.current;
+
+  const first = Math.max(0, Math.floor(scrollTop / LOG_ROW_HEIGHT) - LOG_OVERSCAN);
+  const last = Math.min(shown.length, Math.ceil((scrollTop + viewportHeight) / LOG_ROW_HEIGHT) + LOG_OVERSCAN);
+
+  return (
+    <div ref={containerRef} onScroll={e => setScrollTop(e.currentTarget.scrollTop)} className="flex-1 overflow-y-auto p-10 log-area">
+      <div style={{ height: shown.length * LOG_ROW_HEIGHT }}>
+        <div style={{ transform: `translateY(${first * LOG_ROW_HEIGHT}px)` }}>
+          {shown.slice(first, last).map((l, i) => <LogRow key={l.id ?? first + i} log={l} />)}
+        </div>
+      </div>
+    </div>
+  );
+}
+
+// File bodies are encoded through one byte buffer and TextEncoder, using native Uint8Array base64 where available.
+const UTF8_ENCODER = new TextEncoder();
+const BASE64_CHUNK = 0x8000;
+
+const textToBase64 = (text) => {
+  const bytes = UTF8_ENCODER.encode(text);
+  if (bytes.toBase64) return bytes.toBase64();
+  let binary = '';
+  for (let i = 0; i < bytes.length; i += BASE64_CHUNK) {
+    binary += String.fromCharCode.apply(null, bytes.subarray(i, i + BASE64_CHUNK));
+  }
+  return btoa(binary);
+};
+
+// Content-keyed record of blobs that need no further pass (Gemini left them unchanged, or they are its own output).
+// Git blob shas are already uniform hex, so bloom positions are slices of the sha; the filter answers most misses without touching IndexedDB.
+const BLOB_FILTER_BITS = 1 << 20;
+const BLOB_FILTER_KEY = 'blob-filter';
+
+const bloomPositions = (sha) => [0, 5, 10, 15].map(i => parseInt(sha.slice(i, i + 5), 16) % BLOB_FILTER_BITS);
+
+let blobFilter;
+let blobFilterSave;
+const loadBlobFilter = () => blobFilter ??= shaCache.get(BLOB_FILTER_KEY).then(bits => bits ?? new Uint8Array(BLOB_FILTER_BITS / 8));
+
+const seenBlobs = {
+  has: async (sha) => {
+    const bits = await loadBlobFilter();
+    if (!bloomPositions(sha).every(p => bits[p >> 3] & (1 << (p & 7)))) return false;
+    return Boolean(await shaCache.get(`blob:${sha}`));
+  },
+  add: async (sha) => {
+    const bits = await loadBlobFilter();
+    bloomPositions(sha).forEach(p => { bits[p >> 3] |= 1 << (p & 7); });
+    shaCache.set(`blob:${sha}`, true);
+    clearTimeout(blobFilterSave);
+    blobFilterSave = setTimeout(() => shaCache.set(BLOB_FILTER_KEY, bits), 1000);
+  },
+};